@@ -4,7 +4,7 @@ import subprocess
 import sys
 
 from tmux_pane_mover import __version__
-from tmux_pane_mover.app import TmuxPanes
+from tmux_pane_mover.app import TmuxControl, TmuxPanes, self_target
 
 
 def main() -> None:
@@ -12,26 +12,26 @@ def main() -> None:
         print(f"tmux-pane-mover {__version__}")
         return
 
+    tmux = TmuxControl()
     try:
-        old_pane_title = subprocess.run(
-            ["tmux", "display-message", "-p", "#{pane_title}"],
-            capture_output=True, text=True, check=True,
-        ).stdout.strip()
+        old_pane_title = tmux.run(
+            "display-message", "-p", *self_target(), "#{pane_title}",
+            ";",
+            "select-pane", *self_target(), "-T", "tmux-pane-mover",
+        ).strip()
     except (subprocess.CalledProcessError, FileNotFoundError):
+        tmux.close()
         print("Error: tmux not found or not running inside a tmux session.", file=sys.stderr)
         sys.exit(1)
 
-    subprocess.run(
-        ["tmux", "select-pane", "-T", "tmux-pane-mover"],
-        capture_output=True, check=True,
-    )
     try:
-        TmuxPanes().run()
+        TmuxPanes(tmux).run()
     finally:
-        subprocess.run(
-            ["tmux", "select-pane", "-T", old_pane_title],
-            capture_output=True,
-        )
+        try:
+            tmux.run("select-pane", *self_target(), "-T", old_pane_title)
+        except subprocess.CalledProcessError:
+            pass
+        tmux.close()
 
 
 if __name__ == "__main__":
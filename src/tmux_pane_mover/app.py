@@ -7,13 +7,24 @@ Drop zones while dragging:
 """
 from __future__ import annotations
 
+import asyncio
+import io
+import os
+import queue
+import shlex
 import subprocess
 import sys
+import threading
+import time
 from dataclasses import dataclass
+from itertools import groupby, product
+from operator import itemgetter
 
 from textual.app import App, ComposeResult
 from textual.events import Leave, MouseDown, MouseMove, MouseUp, Resize
+from textual.geometry import Region, Size
 from textual.strip import Strip
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Footer
 from rich.segment import Segment
@@ -26,6 +37,7 @@ SCREEN_EDGE_W  = 4     # columns from screen edge  ->  full-column split zone
 SCREEN_EDGE_H  = 2     # rows    from screen edge  ->  full-row    split zone
 PANE_EDGE_FRAC = 0.28  # fraction of pane dimension that counts as "pane edge"
 FOOTER_H       = 1     # height of the footer widget in rows
+MOVE_INTERVAL  = 1 / 60  # seconds; mouse moves are coalesced to at most one per frame
 
 BOX = {"tl": "\u256d", "tr": "\u256e", "bl": "\u2570", "br": "\u256f", "h": "\u2500", "v": "\u2502"}
 
@@ -42,6 +54,33 @@ ACTION_INFO: dict[str, tuple[str, str]] = {
     "pane_bot":     ("split below",     "\u2568"),
 }
 
+# drop kind -> which side of the target pane box to highlight
+EDGE_MAP: dict[str, str] = {
+    "pane_left": "left", "pane_right": "right",
+    "pane_top":  "top",  "pane_bot":   "bot",
+    "swap":      "center",
+}
+
+# drop kind -> (tmux args, needs target pane). "{src}" is the dragged pane;
+# "{dst}" is the target pane, or any other pane as a window anchor if the
+# action doesn't need a target.
+DROP_ACTIONS: dict[str, tuple[tuple[str, ...], bool]] = {
+    "swap":         (("swap-pane",                         "-s", "{src}", "-t", "{dst}"), True),
+
+    # Screen edges: -f wraps the entire existing layout, producing a true
+    # full-height column or full-width row regardless of which pane is targeted.
+    "screen_left":  (("join-pane", "-d", "-h", "-f", "-b", "-s", "{src}", "-t", "{dst}"), False),
+    "screen_right": (("join-pane", "-d", "-h", "-f",       "-s", "{src}", "-t", "{dst}"), False),
+    "screen_top":   (("join-pane", "-d", "-v", "-f", "-b", "-s", "{src}", "-t", "{dst}"), False),
+    "screen_bot":   (("join-pane", "-d", "-v", "-f",       "-s", "{src}", "-t", "{dst}"), False),
+
+    # Pane edges: split that specific pane (no -f)
+    "pane_left":    (("join-pane", "-d", "-h",       "-b", "-s", "{src}", "-t", "{dst}"), True),
+    "pane_right":   (("join-pane", "-d", "-h",             "-s", "{src}", "-t", "{dst}"), True),
+    "pane_top":     (("join-pane", "-d", "-v",       "-b", "-s", "{src}", "-t", "{dst}"), True),
+    "pane_bot":     (("join-pane", "-d", "-v",             "-s", "{src}", "-t", "{dst}"), True),
+}
+
 # -- data ----------------------------------------------------------------------
 
 @dataclass
@@ -55,42 +94,223 @@ class Pane:
     active: bool
 
 
-def get_panes() -> tuple[list[Pane], int, int]:
-    try:
-        win_w, win_h = map(
-            int,
-            subprocess.run(
-                ["tmux", "display-message", "-p", "#{window_width} #{window_height}"],
-                capture_output=True, text=True, check=True,
-            ).stdout.split(),
-        )
-        lines = subprocess.run(
-            [
-                "tmux", "list-panes", "-F",
-                "#{pane_id}\t#{pane_left}\t#{pane_top}\t"
-                "#{pane_width}\t#{pane_height}\t#{pane_title}\t#{pane_active}",
-            ],
+@dataclass(slots=True)
+class InteractionState:
+    """What the mouse is doing: dragging a pane (and where to), or hovering one."""
+    drag: Pane | None = None
+    dx: int = 0
+    dy: int = 0
+    hover: Pane | None = None
+    drop: tuple[str, Pane | None] | None = None
+
+
+# -- tmux ----------------------------------------------------------------------
+
+# Control-mode notifications after which a cached pane listing is stale
+LAYOUT_NOTIFICATIONS = (b"%layout-change", b"%window-pane-changed")
+
+def self_target() -> list[str]:
+    """``-t`` args naming the pane we run in (what a bare tmux CLI would use)."""
+    pane = os.environ.get("TMUX_PANE")
+    return ["-t", pane] if pane else []
+
+
+class TmuxControl:
+    """Runs tmux commands over one long-lived ``tmux -C`` control-mode client.
+
+    Each command is a line written to the client's stdin; the reply is the
+    ``%begin``/``%end`` block it prints back. A reader thread hands replies
+    over and sets ``layout_changed`` when tmux reports a layout change. If
+    the client can't be started (or dies), commands fall back to spawning
+    one ``tmux`` process each, and ``layout_changed`` is never set.
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._out: io.BufferedReader | None = None
+        self._lock = threading.Lock()  # one command on the pipe at a time
+        self._replies: queue.SimpleQueue[tuple[bool, str] | None] = queue.SimpleQueue()
+        self.layout_changed = threading.Event()
+        try:
+            self._proc = subprocess.Popen(
+                ["tmux", "-C", "attach", *self_target()],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, bufsize=0,
+            )
+        except OSError:
+            return
+        assert self._proc.stdout is not None
+        self._out = io.BufferedReader(self._proc.stdout)
+        threading.Thread(target=self._read_loop, daemon=True).start()
+
+        # Commands written before the attach completes run without a client
+        # (and so against the wrong session) -- wait for its reply block.
+        reply = self._replies.get()
+        if reply is None or not reply[0]:
+            self.close()
+            return
+        # We only read command replies; keep pane output off the pipe.
+        try:
+            self.run("refresh-client", "-f", "no-output")
+        except subprocess.CalledProcessError:
+            pass  # tmux < 3.2
+
+    def _read_loop(self) -> None:
+        """Queue reply blocks for _run; a None entry means the client is gone."""
+        attached = False
+        while (block := self._read_block()) is not None:
+            ours, ok, out = block
+            # Before attaching, the first block is the attach itself; after
+            # that, blocks we didn't ask for (flags 0) aren't replies to us.
+            if ours or not attached:
+                self._replies.put((ok, out))
+                attached = True
+        self._replies.put(None)
+
+    def _read_block(self) -> tuple[bool, bool, str] | None:
+        """Read up to the next reply block: (ours, succeeded, output), or None on EOF."""
+        assert self._out is not None
+        while True:
+            line = self._out.readline()
+            if not line:
+                return None
+            fields = line.split()
+            if len(fields) != 4 or fields[0] != b"%begin":
+                if line.startswith(LAYOUT_NOTIFICATIONS):
+                    self.layout_changed.set()
+                continue
+            tag = fields[1:3]
+            body: list[bytes] = []
+            while True:
+                line = self._out.readline()
+                if not line:
+                    return None
+                end = line.split()
+                if len(end) == 4 and end[0] in (b"%end", b"%error") and end[1:3] == tag:
+                    break
+                body.append(line)
+            return fields[3] != b"0", end[0] == b"%end", b"".join(body).decode(errors="replace")
+
+    def run(self, *args: str) -> str:
+        """Run a tmux command and return its output.
+
+        As on the tmux command line, a ``";"`` argument chains further
+        commands, which all run in one go; their output is concatenated.
+        Raises ``subprocess.CalledProcessError`` on failure, like ``check=True``.
+        """
+        with self._lock:
+            return self._run(args)
+
+    def _run(self, args: tuple[str, ...]) -> str:
+        if self._proc is not None:
+            assert self._proc.stdin is not None
+            commands: list[list[str]] = [[]]
+            for arg in args:
+                if arg == ";":
+                    commands.append([])
+                else:
+                    commands[-1].append(arg)
+            line = " ; ".join(shlex.join(cmd) for cmd in commands)
+            try:
+                self._proc.stdin.write((line + "\n").encode())
+                # One reply block per command, up to the first that fails
+                # (tmux drops the rest of the chain).
+                replies: list[tuple[bool, str]] = []
+                while len(replies) < len(commands):
+                    reply = self._replies.get()
+                    if reply is None:
+                        break
+                    replies.append(reply)
+                    if not reply[0]:
+                        break
+            except OSError:
+                replies = []
+            if replies and (len(replies) == len(commands) or not replies[-1][0]):
+                out = "".join(out for _, out in replies)
+                if not replies[-1][0]:
+                    raise subprocess.CalledProcessError(1, ["tmux", *args], out, replies[-1][1])
+                return out
+            self.close()  # control client went away; spawn from now on
+        return subprocess.run(
+            ["tmux", *args],
             capture_output=True, text=True, check=True,
-        ).stdout.strip().splitlines()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("Error: tmux not found or not running inside a tmux session.", file=sys.stderr)
-        sys.exit(1)
+        ).stdout
+
+    async def run_async(self, *args: str) -> str:
+        """Like run, but without blocking the event loop."""
+        if self._proc is not None:
+            return await asyncio.to_thread(self.run, *args)
+        proc = await asyncio.create_subprocess_exec(
+            "tmux", *args,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        )
+        out, err = await proc.communicate()
+        if proc.returncode:
+            raise subprocess.CalledProcessError(
+                proc.returncode, ["tmux", *args], out.decode(), err.decode(),
+            )
+        return out.decode()
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        try:
+            assert proc.stdin is not None
+            proc.stdin.close()  # detaches the control client
+            proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+
+FIELD_SEP = "\x1f"
+PANES_CMD = (
+    "display-message", "-p", *self_target(),
+    "#{window_width} #{window_height}",
+    ";",
+    "list-panes", *self_target(), "-F",
+    # Unit-separated, title last: even a title containing the separator
+    # only ever lands in the final field of split(FIELD_SEP, 6)
+    FIELD_SEP.join((
+        "#{pane_id}", "#{pane_left}", "#{pane_top}",
+        "#{pane_width}", "#{pane_height}", "#{pane_active}", "#{pane_title}",
+    )),
+)
+
+
+def parse_panes(out: str) -> tuple[list[Pane], int, int]:
+    """Parse PANES_CMD output: window size on the first line, then the panes."""
+    # Only trim newlines: strip() would also eat a trailing FIELD_SEP (it
+    # counts as whitespace) when the last pane's title is empty
+    size, *lines = out.rstrip("\n").split("\n")
+    win_w, win_h = map(int, size.split())
 
     panes = []
     for line in lines:
-        p = line.split("\t")
-        if len(p) < 7:
-            continue
+        pid, left, top, width, height, active, title = line.split(FIELD_SEP, 6)
         panes.append(Pane(
-            id=p[0],
-            left=int(p[1]), top=int(p[2]),
-            width=int(p[3]), height=int(p[4]),
-            title=(p[5] or p[0])[:24],
-            active=p[6] == "1",
+            id=pid,
+            left=int(left), top=int(top),
+            width=int(width), height=int(height),
+            title=(title or pid)[:24],
+            active=active == "1",
         ))
     return panes, win_w, win_h
 
 
+def get_panes(tmux: TmuxControl) -> tuple[list[Pane], int, int]:
+    try:
+        return parse_panes(tmux.run(*PANES_CMD))
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        print("Error: tmux not found or not running inside a tmux session.", file=sys.stderr)
+        sys.exit(1)
+
+
+async def get_panes_async(tmux: TmuxControl) -> tuple[list[Pane], int, int]:
+    """Like get_panes, but raises instead of exiting on tmux errors."""
+    return parse_panes(await tmux.run_async(*PANES_CMD))
+
+
 # -- types ---------------------------------------------------------------------
 
 Canvas = list[list[tuple[str, Style]]]
@@ -113,52 +333,125 @@ ZONE_LIT  = Style(bgcolor="#002266", color="#66aaff", bold=True)
 LABEL_S   = Style(bgcolor="#440066", color="#ff88ff", bold=True)
 
 
+def _box_styles(
+    dragging: bool, active_edge: str | None, active: bool, hover: bool,
+) -> tuple[Style, Style]:
+    """(border, fill) styles for a pane box."""
+    if dragging:
+        bs = (S_EDGE_HL if active_edge and active_edge != "center"
+              else S_HOVER  if active_edge == "center"
+              else S_ACTIVE if active else S_NORMAL)
+        fs = (F_HOVER  if active_edge
+              else F_ACTIVE if active else F_NORMAL)
+    else:
+        bs = S_HOVER if hover else (S_ACTIVE if active else S_NORMAL)
+        fs = F_HOVER if hover else (F_ACTIVE if active else F_NORMAL)
+    return bs, fs
+
+
+# (dragging, active_edge, pane active, hovered) -> (border, fill) styles
+BOX_STYLES: dict[tuple[bool, str | None, bool, bool], tuple[Style, Style]] = {
+    key: _box_styles(*key)
+    for key in product((False, True), (None, *EDGE_MAP.values()), (False, True), (False, True))
+}
+
+
 # -- widget --------------------------------------------------------------------
 
 class PaneMap(Widget):
     DEFAULT_CSS = "PaneMap { width: 1fr; height: 1fr; }"
 
-    def __init__(self, panes: list[Pane], win_w: int, win_h: int) -> None:
+    def __init__(self, tmux: TmuxControl, panes: list[Pane], win_w: int, win_h: int) -> None:
         super().__init__()
+        self.tmux = tmux
         self.panes = panes
         self.win_w = win_w
         self.win_h = win_h
-        self._drag: Pane | None = None
-        self._drag_x = 0
-        self._drag_y = 0
-        self._hover: Pane | None = None
-        self._drop: tuple[str, Pane | None] | None = None
+        self._state = InteractionState()
         self._canvas: Canvas | None = None
+        # Reused across rebuilds; (re)allocated by _recompute_layout on resize
+        self._canvas_buf: Canvas = []
+        self._blank_row: list[tuple[str, Style]] = []
+        # self.panes doubles as a short-lived cache of the tmux listing
+        self._panes_cache_ts = time.monotonic()
+        self._panes_cache_ttl = 0.5  # seconds
+        self._panes_dirty = False
+        self._pending_move: tuple[int, int] | None = None
+        self._move_timer: Timer | None = None
+        # Layout cache, rebuilt by _recompute_layout on resize/reload
+        self._layout_size: Size | None = None
+        # Scale is (screen span) / (tmux span), kept as integers so the
+        # coordinate helpers can round with integer math only
+        self._w2 = self._h2 = 0
+        self._wn = self._hn = 1
+        self._sw_cache: dict[int, int] = {}
+        self._sh_cache: dict[int, int] = {}
+        self._rects: list[tuple[int, int, int, int]] = []  # parallel to panes
+        # (kind, x, y, w, h, char) for each screen-edge drop zone
+        self._screen_zones: list[tuple[str, int, int, int, int, str]] = []
+        self._bounds: list[tuple[int, int, int, int]] = []  # (x0, y0, x1, y1) of _rects
 
     # -- coordinate helpers ----------------------------------------------------
 
+    def _recompute_layout(self) -> None:
+        """Cache the tmux -> screen scale factors, pane rects and drop zones."""
+        self._layout_size = self.size
+        self._w2, self._wn = self.size.width - 2, max(1, self.win_w)
+        self._h2, self._hn = self.size.height - 2, max(1, self.win_h)
+        self._sw_cache = {}
+        self._sh_cache = {}
+        self._rects = [
+            (self._sx(p.left), self._sy(p.top), self._sw(p.width), self._sh(p.height))
+            for p in self.panes
+        ]
+        self._bounds = [(px, py, px + pw, py + ph) for px, py, pw, ph in self._rects]
+        cw, ch = self.size.width, self.size.height
+        if len(self._blank_row) != cw or len(self._canvas_buf) != ch:
+            self._blank_row = [(" ", Style.null())] * cw
+            self._canvas_buf = [self._blank_row[:] for _ in range(ch)]
+        self._screen_zones = [
+            ("screen_left",  0,                          0,                         SCREEN_EDGE_W, ch - FOOTER_H,            "\u25c0"),
+            ("screen_right", cw - SCREEN_EDGE_W,         0,                         SCREEN_EDGE_W, ch - FOOTER_H,            "\u25b6"),
+            ("screen_top",   0,                          0,                         cw,            SCREEN_EDGE_H,            "\u25b2"),
+            ("screen_bot",   0,                          ch - FOOTER_H - SCREEN_EDGE_H, cw,       SCREEN_EDGE_H,            "\u25bc"),
+        ]
+
     def _sx(self, tx: int) -> int:
-        return round(tx * (self.size.width - 2) / max(1, self.win_w)) + 1
+        return (tx * self._w2 + self._wn // 2) // self._wn + 1
 
     def _sy(self, ty: int) -> int:
-        return round(ty * (self.size.height - 2) / max(1, self.win_h)) + 1
+        return (ty * self._h2 + self._hn // 2) // self._hn + 1
 
     def _sw(self, tw: int) -> int:
-        return max(5, round(tw * (self.size.width - 2) / max(1, self.win_w)))
+        sw = self._sw_cache.get(tw)
+        if sw is None:
+            sw = self._sw_cache[tw] = max(5, (tw * self._w2 + self._wn // 2) // self._wn)
+        return sw
 
     def _sh(self, th: int) -> int:
-        return max(3, round(th * (self.size.height - 2) / max(1, self.win_h)))
+        sh = self._sh_cache.get(th)
+        if sh is None:
+            sh = self._sh_cache[th] = max(3, (th * self._h2 + self._hn // 2) // self._hn)
+        return sh
+
+    def _index_at(self, x: int, y: int, skip_drag: bool = True) -> int:
+        """Index into self.panes of the pane under (x, y), or -1."""
+        for i, (x0, y0, x1, y1) in enumerate(self._bounds):
+            if x0 <= x < x1 and y0 <= y < y1:
+                if skip_drag and self.panes[i] is self._state.drag:
+                    continue
+                return i
+        return -1
 
     def _pane_at(self, x: int, y: int, skip_drag: bool = True) -> Pane | None:
-        for pane in self.panes:
-            if skip_drag and pane is self._drag:
-                continue
-            px, py = self._sx(pane.left), self._sy(pane.top)
-            pw, ph = self._sw(pane.width), self._sh(pane.height)
-            if px <= x < px + pw and py <= y < py + ph:
-                return pane
-        return None
+        i = self._index_at(x, y, skip_drag)
+        return self.panes[i] if i >= 0 else None
 
     # -- drop-zone logic -------------------------------------------------------
 
     def _get_drop(self, x: int, y: int) -> tuple[str, Pane | None] | None:
         """Return (action_kind, target_pane_or_None) for cursor position."""
-        if not self._drag:
+        if not self._state.drag:
             return None
         cw, ch = self.size.width, self.size.height
 
@@ -173,10 +466,10 @@ class PaneMap(Widget):
             return ("screen_bot", None)
 
         # Pane edge vs. center
-        pane = self._pane_at(x, y)
-        if pane:
-            px, py = self._sx(pane.left), self._sy(pane.top)
-            pw, ph = self._sw(pane.width), self._sh(pane.height)
+        i = self._index_at(x, y)
+        if i >= 0:
+            pane = self.panes[i]
+            px, py, pw, ph = self._rects[i]
             rx = (x - px) / max(1, pw - 1)
             ry = (y - py) / max(1, ph - 1)
             if   rx < PANE_EDGE_FRAC:         return ("pane_left",  pane)
@@ -189,124 +482,131 @@ class PaneMap(Widget):
 
     # -- tmux operations -------------------------------------------------------
 
-    def _apply_drop(self, kind: str, target: Pane | None) -> None:
-        if self._drag is None:
+    async def _apply_drop(self, drag: Pane, kind: str, target: Pane | None) -> None:
+        spec = DROP_ACTIONS.get(kind)
+        if spec is None:
+            return
+        template, needs_target = spec
+        if needs_target:
+            dst = target.id if target else None
+        else:
+            # Any non-drag pane -- needed as a window anchor for -f operations
+            dst = next((p.id for p in self.panes if p is not drag), None)
+        if dst is None:
             return
-        src = self._drag.id
-        # Any non-drag pane -- needed as a window anchor for -f operations
-        anchor = next((p.id for p in self.panes if p is not self._drag), None)
-
-        def run_tmux(*args: str) -> None:
-            result = subprocess.run(
-                ["tmux", *args],
-                capture_output=True, text=True,
-            )
-            if result.returncode != 0:
-                msg = result.stderr.strip() or f"tmux command failed: {' '.join(args)}"
-                self.app.notify(msg, severity="error", timeout=4)
-
-        if kind == "swap" and target:
-            run_tmux("swap-pane", "-s", src, "-t", target.id)
-
-        # Screen edges: -f wraps the entire existing layout, producing a true
-        # full-height column or full-width row regardless of which pane is targeted.
-        elif kind == "screen_left"  and anchor: run_tmux("join-pane", "-d", "-h", "-f", "-b", "-s", src, "-t", anchor)
-        elif kind == "screen_right" and anchor: run_tmux("join-pane", "-d", "-h", "-f",       "-s", src, "-t", anchor)
-        elif kind == "screen_top"   and anchor: run_tmux("join-pane", "-d", "-v", "-f", "-b", "-s", src, "-t", anchor)
-        elif kind == "screen_bot"   and anchor: run_tmux("join-pane", "-d", "-v", "-f",       "-s", src, "-t", anchor)
-
-        # Pane edges: split that specific pane (no -f)
-        elif kind == "pane_left"  and target:  run_tmux("join-pane", "-d", "-h", "-b", "-s", src, "-t", target.id)
-        elif kind == "pane_right" and target:  run_tmux("join-pane", "-d", "-h",       "-s", src, "-t", target.id)
-        elif kind == "pane_top"   and target:  run_tmux("join-pane", "-d", "-v", "-b", "-s", src, "-t", target.id)
-        elif kind == "pane_bot"   and target:  run_tmux("join-pane", "-d", "-v",       "-s", src, "-t", target.id)
+
+        fields = {"{src}": drag.id, "{dst}": dst}
+        args = [fields.get(a, a) for a in template]
+        try:
+            await self.tmux.run_async(*args)
+        except subprocess.CalledProcessError as e:
+            msg = (e.stderr or "").strip() or f"tmux command failed: {' '.join(args)}"
+            self.app.notify(msg, severity="error", timeout=4)
+        else:
+            self._panes_dirty = True
 
     # -- canvas building -------------------------------------------------------
 
+    def _ghost_region(self, st: InteractionState) -> Region | None:
+        """Screen region covered by st's drag ghost and its action label."""
+        if not st.drag:
+            return None
+        pw = self._sw(st.drag.width)
+        ph = self._sh(st.drag.height)
+        return Region(
+            st.dx - pw // 2, st.dy - ph // 2,
+            max(pw, 1 + len(self._drop_label(st.drop))), ph,
+        )
+
+    def _drop_label(self, drop: tuple[str, Pane | None] | None) -> str:
+        if not drop:
+            return ""
+        kind = drop[0]
+        lbl, icon = ACTION_INFO.get(kind, (kind, ""))
+        return f" {icon} {lbl} "
+
+    def _drop_region(self, drop: tuple[str, Pane | None] | None) -> Region | None:
+        """Screen region whose highlight depends on drop being the current one."""
+        if drop is None:
+            return None
+        kind, pane = drop
+        if pane is None:
+            for zkind, zx, zy, zw, zh, _ in self._screen_zones:
+                if zkind == kind:
+                    return Region(zx, zy, zw, zh)
+            return None
+        return self._pane_region(pane)
+
+    def _pane_region(self, pane: Pane | None) -> Region | None:
+        if pane is None or pane not in self.panes:
+            return None
+        return Region(*self._rects[self.panes.index(pane)])
+
     def _build_canvas(self) -> Canvas:
-        cw, ch = self.size.width, self.size.height
-        canvas: Canvas = [
-            [(" ", Style.null())] * cw for _ in range(ch)
-        ]
+        canvas = self._canvas_buf
+        for row in canvas:
+            row[:] = self._blank_row
+        self._paint(canvas, self.size.region)
+        return canvas
 
-        drop_kind, drop_pane = self._drop if self._drop else (None, None)
+    def _paint(self, canvas: Canvas, clip: Region) -> None:
+        """Draw every layer onto canvas, writing only the cells inside clip."""
+        cx0, cy0, cx1, cy1 = clip.x, clip.y, clip.right, clip.bottom
+        st = self._state
+        drop_kind, drop_pane = st.drop if st.drop else (None, None)
 
         # 1. Pane boxes
-        for pane in self.panes:
-            if pane is self._drag:
+        for pane, (px, py, pw, ph) in zip(self.panes, self._rects):
+            if pane is st.drag:
+                continue
+            if px >= cx1 or py >= cy1 or px + pw <= cx0 or py + ph <= cy0:
                 continue
 
             active_edge: str | None = None
-            if self._drag and pane is drop_pane:
-                active_edge = {
-                    "pane_left": "left", "pane_right": "right",
-                    "pane_top":  "top",  "pane_bot":   "bot",
-                    "swap":      "center",
-                }.get(drop_kind)  # type: ignore[arg-type]
-
-            if self._drag:
-                bs = (S_EDGE_HL if active_edge and active_edge != "center"
-                      else S_HOVER  if active_edge == "center"
-                      else S_ACTIVE if pane.active else S_NORMAL)
-                fs = (F_HOVER  if active_edge
-                      else F_ACTIVE if pane.active else F_NORMAL)
-            else:
-                bs = S_HOVER if pane is self._hover else (S_ACTIVE if pane.active else S_NORMAL)
-                fs = F_HOVER if pane is self._hover else (F_ACTIVE if pane.active else F_NORMAL)
+            if st.drag and pane is drop_pane:
+                active_edge = EDGE_MAP.get(drop_kind)  # type: ignore[arg-type]
 
-            self._draw_box(
-                canvas,
-                self._sx(pane.left), self._sy(pane.top),
-                self._sw(pane.width), self._sh(pane.height),
-                f"{pane.id} {pane.title}", bs, fs,
-                active_edge=active_edge,
-            )
+            bs, fs = BOX_STYLES[(st.drag is not None, active_edge, pane.active, pane is st.hover)]
+
+            title = f"{pane.id} {pane.title}"
+            if active_edge and active_edge != "center":
+                self._draw_box_highlighted(canvas, px, py, pw, ph, title, bs, fs, clip, active_edge)
+            else:
+                self._draw_box(canvas, px, py, pw, ph, title, bs, fs, clip)
 
         # 2. Screen-edge drop zones (only while dragging)
-        if self._drag:
-            self._draw_screen_zones(canvas, drop_kind)
+        if st.drag:
+            self._draw_screen_zones(canvas, drop_kind, clip)
 
         # 3. Drag ghost
-        if self._drag:
-            pw = self._sw(self._drag.width)
-            ph = self._sh(self._drag.height)
-            gx = self._drag_x - pw // 2
-            gy = self._drag_y - ph // 2
+        if st.drag:
+            pw = self._sw(st.drag.width)
+            ph = self._sh(st.drag.height)
+            gx = st.dx - pw // 2
+            gy = st.dy - ph // 2
             self._draw_box(
                 canvas, gx, gy, pw, ph,
-                f"\u2827 {self._drag.id} {self._drag.title}", S_DRAG, F_DRAG,
+                f"\u2827 {st.drag.id} {st.drag.title}", S_DRAG, F_DRAG, clip,
             )
 
             # 4. Action label just inside the ghost's top border
-            if self._drop:
-                lbl, icon = ACTION_INFO.get(drop_kind, (drop_kind, ""))  # type: ignore[arg-type]
-                text = f" {icon} {lbl} "
-                for i, char in enumerate(text):
-                    cx, cy = gx + 1 + i, gy + 1
-                    if 0 <= cx < cw and 0 <= cy < ch:
-                        canvas[cy][cx] = (char, LABEL_S)
-
-        return canvas
+            if st.drop:
+                self._draw_text(canvas, gx + 1, gy + 1, self._drop_label(st.drop), LABEL_S, clip)
 
     def _draw_screen_zones(
-        self, canvas: Canvas, active_kind: str | None,
+        self, canvas: Canvas, active_kind: str | None, clip: Region,
     ) -> None:
-        cw, ch = self.size.width, self.size.height
+        bottom = min(clip.bottom, self.size.height - FOOTER_H)
 
         def fill(x: int, y: int, w: int, h: int, char: str, s: Style) -> None:
-            for dy in range(h):
-                for dx in range(w):
-                    cx, cy = x + dx, y + dy
-                    if 0 <= cx < cw and 0 <= cy < ch - FOOTER_H:
-                        canvas[cy][cx] = (char, s)
-
-        zones = [
-            ("screen_left",  0,                          0,                         SCREEN_EDGE_W, ch - FOOTER_H,            "\u25c0"),
-            ("screen_right", cw - SCREEN_EDGE_W,         0,                         SCREEN_EDGE_W, ch - FOOTER_H,            "\u25b6"),
-            ("screen_top",   0,                          0,                         cw,            SCREEN_EDGE_H,            "\u25b2"),
-            ("screen_bot",   0,                          ch - FOOTER_H - SCREEN_EDGE_H, cw,       SCREEN_EDGE_H,            "\u25bc"),
-        ]
-        for kind, zx, zy, zw, zh, char in zones:
+            x0, x1 = max(clip.x, x), min(clip.right, x + w)
+            if x0 >= x1:
+                return
+            run = [(char, s)] * (x1 - x0)
+            for cy in range(max(clip.y, y), min(bottom, y + h)):
+                canvas[cy][x0:x1] = run
+
+        for kind, zx, zy, zw, zh, char in self._screen_zones:
             fill(zx, zy, zw, zh, char, ZONE_LIT if kind == active_kind else ZONE_DIM)
 
     def _draw_box(
@@ -315,40 +615,67 @@ class PaneMap(Widget):
         x: int, y: int, w: int, h: int,
         title: str,
         bs: Style, fs: Style,
-        active_edge: str | None = None,
+        clip: Region,
     ) -> None:
-        cw, ch = self.size.width, self.size.height
-        for dy in range(h):
-            for dx in range(w):
-                cx, cy = x + dx, y + dy
-                if not (0 <= cx < cw and 0 <= cy < ch):
-                    continue
-                top    = dy == 0
-                bottom = dy == h - 1
-                left   = dx == 0
-                right  = dx == w - 1
-                hi = (
-                    (active_edge == "left"   and left)   or
-                    (active_edge == "right"  and right)  or
-                    (active_edge == "top"    and top)    or
-                    (active_edge == "bot"    and bottom)
-                )
-                cur_bs = S_EDGE_HL if hi else bs
-                if   top    and left:  c, s = BOX["tl"], cur_bs
-                elif top    and right: c, s = BOX["tr"], cur_bs
-                elif bottom and left:  c, s = BOX["bl"], cur_bs
-                elif bottom and right: c, s = BOX["br"], cur_bs
-                elif top    or bottom: c, s = BOX["h"],  cur_bs
-                elif left   or right:  c, s = BOX["v"],  cur_bs
-                else:                  c, s = " ",       fs
-                canvas[cy][cx] = (c, s)
-
-        if w > 5 and 0 <= y < ch:
-            label = f" {title[:w - 5]} "
-            for i, char in enumerate(label):
-                cx = x + 2 + i
-                if 0 <= cx < cw:
-                    canvas[y][cx] = (char, bs)
+        inner = w - 2
+        self._draw_frame(
+            canvas, x, y, w, h, clip,
+            [(BOX["tl"], bs)] + [(BOX["h"], bs)] * inner + [(BOX["tr"], bs)],
+            [(BOX["v"],  bs)] + [(" ", fs)] * inner      + [(BOX["v"],  bs)],
+            [(BOX["bl"], bs)] + [(BOX["h"], bs)] * inner + [(BOX["br"], bs)],
+        )
+        if w > 5:
+            self._draw_text(canvas, x + 2, y, f" {title[:w - 5]} ", bs, clip)
+
+    def _draw_box_highlighted(
+        self,
+        canvas: Canvas,
+        x: int, y: int, w: int, h: int,
+        title: str,
+        bs: Style, fs: Style,
+        clip: Region,
+        active_edge: str,
+    ) -> None:
+        """Like _draw_box, with the active_edge side of the border in S_EDGE_HL."""
+        def side(*edges: str) -> Style:
+            return S_EDGE_HL if active_edge in edges else bs
+
+        inner = w - 2
+        self._draw_frame(
+            canvas, x, y, w, h, clip,
+            [(BOX["tl"], side("left", "top"))] + [(BOX["h"], side("top"))] * inner + [(BOX["tr"], side("right", "top"))],
+            [(BOX["v"],  side("left"))]        + [(" ", fs)] * inner               + [(BOX["v"],  side("right"))],
+            [(BOX["bl"], side("left", "bot"))] + [(BOX["h"], side("bot"))] * inner + [(BOX["br"], side("right", "bot"))],
+        )
+        if w > 5:
+            self._draw_text(canvas, x + 2, y, f" {title[:w - 5]} ", bs, clip)
+
+    def _draw_frame(
+        self,
+        canvas: Canvas,
+        x: int, y: int, w: int, h: int,
+        clip: Region,
+        top_row: list[tuple[str, Style]],
+        mid_row: list[tuple[str, Style]],
+        bot_row: list[tuple[str, Style]],
+    ) -> None:
+        """Copy whole-width row templates into the box's rows, clipped to clip."""
+        x0, x1 = max(x, clip.x), min(x + w, clip.right)
+        if x0 >= x1:
+            return
+        lo, hi = x0 - x, x1 - x
+        for cy in range(max(y, clip.y), min(y + h, clip.bottom)):
+            row = top_row if cy == y else bot_row if cy == y + h - 1 else mid_row
+            canvas[cy][x0:x1] = row[lo:hi]
+
+    def _draw_text(
+        self, canvas: Canvas, x: int, y: int, text: str, s: Style, clip: Region,
+    ) -> None:
+        if not clip.y <= y < clip.bottom:
+            return
+        x0, x1 = max(x, clip.x), min(x + len(text), clip.right)
+        if x0 < x1:
+            canvas[y][x0:x1] = [(c, s) for c in text[x0 - x:x1 - x]]
 
     # -- rendering -------------------------------------------------------------
 
@@ -356,68 +683,136 @@ class PaneMap(Widget):
         self._canvas = None
         self.refresh()
 
+    def _refresh_dirty(self, prev: InteractionState) -> None:
+        """Repaint only what changed since the previous interaction state.
+
+        Used for mouse moves; resizes and reloads still rebuild the whole canvas.
+        """
+        if self._canvas is None:
+            self.refresh()  # full rebuild already pending
+            return
+        st = self._state
+        damage = [self._ghost_region(prev), self._ghost_region(st)]
+        if st.drop != prev.drop:
+            damage += [self._drop_region(prev.drop), self._drop_region(st.drop)]
+        if st.hover is not prev.hover:
+            damage += [self._pane_region(prev.hover), self._pane_region(st.hover)]
+
+        screen = self.size.region
+        regions = [r.intersection(screen) for r in damage if r is not None]
+        regions = [r for r in regions if r]
+        for region in regions:
+            blank = self._blank_row[:region.width]
+            for cy in range(region.y, region.bottom):
+                self._canvas[cy][region.x:region.right] = blank
+            self._paint(self._canvas, region)
+        if regions:
+            self.refresh(*regions)
+
     def render_line(self, y: int) -> Strip:
         if self._canvas is None:
             if self.size.width == 0 or self.size.height == 0:
                 return Strip.blank(0)
+            if self._layout_size != self.size:
+                self._recompute_layout()
             self._canvas = self._build_canvas()
         if y >= len(self._canvas):
             return Strip.blank(self.size.width)
-        return Strip([Segment(ch, st) for ch, st in self._canvas[y]])
+        # One segment per run of same-style cells rather than one per cell
+        return Strip([
+            Segment("".join(ch for ch, _ in run), st)
+            for st, run in groupby(self._canvas[y], key=itemgetter(1))
+        ])
 
     # -- events ----------------------------------------------------------------
 
     def on_resize(self, _: Resize) -> None:
+        self._recompute_layout()
         self._invalidate()
 
     def on_mouse_down(self, event: MouseDown) -> None:
         pane = self._pane_at(event.x, event.y, skip_drag=False)
         if pane:
-            self._drag = pane
-            self._drag_x = event.x
-            self._drag_y = event.y
-            self._hover = None
-            self._drop = None
+            self._state = InteractionState(drag=pane, dx=event.x, dy=event.y)
+            self._pending_move = None
             self.capture_mouse()
             self._invalidate()
 
     def on_mouse_move(self, event: MouseMove) -> None:
-        if self._drag:
-            self._drag_x = event.x
-            self._drag_y = event.y
-            self._drop = self._get_drop(event.x, event.y)
-            self._invalidate()
+        # Only the latest position matters; handle it on the next tick so a
+        # burst of terminal mouse reports costs one repaint.
+        self._pending_move = (event.x, event.y)
+        if self._move_timer is None:
+            self._move_timer = self.set_timer(MOVE_INTERVAL, self._process_move)
+
+    def _process_move(self) -> None:
+        self._move_timer = None
+        if self._pending_move is None:
+            return
+        x, y = self._pending_move
+        self._pending_move = None
+        prev = self._state
+        if prev.drag:
+            drop = self._get_drop(x, y)
+            # The ghost is a fixed-size box centred on the cursor, so it only
+            # moves if the cursor's cell does
+            if (x, y) == (prev.dx, prev.dy) and drop == prev.drop:
+                return
+            self._state = InteractionState(drag=prev.drag, dx=x, dy=y, drop=drop)
+            self._refresh_dirty(prev)
         else:
-            new_hover = self._pane_at(event.x, event.y)
-            if new_hover is not self._hover:
-                self._hover = new_hover
-                self._invalidate()
+            new_hover = self._pane_at(x, y)
+            if new_hover is not prev.hover:
+                self._state = InteractionState(hover=new_hover)
+                self._refresh_dirty(prev)
 
     def on_mouse_up(self, event: MouseUp) -> None:
-        if not self._drag:
+        drag = self._state.drag
+        if not drag:
             return
         drop = self._get_drop(event.x, event.y)
-        did_drop = False
         if drop:
             kind, target = drop
-            self._apply_drop(kind, target)
-            lbl, icon = ACTION_INFO.get(kind, (kind, ""))
-            self.app.notify(f"{icon} {lbl}", timeout=2)
-            did_drop = True
-        self._drag = None
-        self._drop = None
+            self.run_worker(self._drop_pane(drag, kind, target), group="drop")
+        self._state = InteractionState()
+        self._pending_move = None
         self.release_mouse()
-        if did_drop:
-            self._reload()
         self._invalidate()
 
     def on_leave(self, _: Leave) -> None:
-        if self._hover:
-            self._hover = None
+        self._pending_move = None
+        if self._state.hover:
+            self._state = InteractionState()
             self._invalidate()
 
-    def _reload(self) -> None:
-        self.panes, self.win_w, self.win_h = get_panes()
+    async def _drop_pane(self, drag: Pane, kind: str, target: Pane | None) -> None:
+        await self._apply_drop(drag, kind, target)
+        lbl, icon = ACTION_INFO.get(kind, (kind, ""))
+        self.app.notify(f"{icon} {lbl}", timeout=2)
+        await self._reload()
+
+    async def _reload(self, force: bool = False) -> None:
+        """Re-read the panes from tmux, unless the current listing is known good.
+
+        The listing is reused if it is younger than the cache TTL, no drop has
+        changed the layout since, and the control client hasn't reported a
+        layout change. ``force`` always re-reads.
+        """
+        changed = self.tmux.layout_changed.is_set()
+        age = time.monotonic() - self._panes_cache_ts
+        if not (force or changed or self._panes_dirty or age >= self._panes_cache_ttl):
+            return
+        self.tmux.layout_changed.clear()
+        try:
+            self.panes, self.win_w, self.win_h = await get_panes_async(self.tmux)
+        except (subprocess.CalledProcessError, FileNotFoundError, ValueError) as e:
+            msg = (getattr(e, "stderr", None) or "").strip() or "failed to list tmux panes"
+            self.app.notify(msg, severity="error", timeout=4)
+            return
+        self._panes_cache_ts = time.monotonic()
+        self._panes_dirty = False
+        self._recompute_layout()
+        self._invalidate()
 
 
 # -- app -----------------------------------------------------------------------
@@ -432,12 +827,15 @@ class TmuxPanes(App):
         ("r", "reload", "Reload"),
     ]
 
+    def __init__(self, tmux: TmuxControl) -> None:
+        super().__init__()
+        self.tmux = tmux
+
     def compose(self) -> ComposeResult:
-        panes, win_w, win_h = get_panes()
-        yield PaneMap(panes, win_w, win_h)
+        panes, win_w, win_h = get_panes(self.tmux)
+        yield PaneMap(self.tmux, panes, win_w, win_h)
         yield Footer()
 
     def action_reload(self) -> None:
         widget = self.query_one(PaneMap)
-        widget._reload()
-        widget._invalidate()
+        widget.run_worker(widget._reload(force=True), group="reload", exclusive=True)